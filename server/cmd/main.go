@@ -28,8 +28,8 @@ This function performs the following steps:
     necessary configurations for the server.
  2. Initializes the request handlers by calling `cfg.InitialiseHandlers()` to set up
     handler functions based on the configuration.
- 3. Creates a new API instance using `api.NewAPI(handlers)` and initializes it with
-    the handlers.
+ 3. Creates a new API instance using `api.NewAPI(cfg, handlers)` and initializes it
+    with the configuration and the handlers.
  4. Starts the server with the `server.Run()` function, which listens for HTTP requests
     and processes them based on the defined handlers.
 
@@ -46,6 +46,6 @@ the server is stopped.
 func main() {
 	cfg := config.NewConfig()
 	handlers := cfg.InitialiseHandlers()
-	server := api.NewAPI(handlers)
+	server := api.NewAPI(cfg, handlers)
 	server.Run()
 }
@@ -20,6 +20,7 @@ package api
 import (
 	"errors"
 	"log"
+	"net"
 	"net/http"
 	"time"
 
@@ -28,6 +29,7 @@ import (
 
 	"github.com/Weburz/burzcontent/server/internal/api/handlers"
 	"github.com/Weburz/burzcontent/server/internal/api/routes"
+	"github.com/Weburz/burzcontent/server/internal/config"
 )
 
 /*
@@ -38,46 +40,58 @@ Fields:
   - Router: The router (of type *chi.Mux) used for routing HTTP requests to handlers.
     It is based on the chi router, which provides a fast and lightweight way to handle
     routing for RESTful APIs and other HTTP requests.
+  - Config: The configuration settings (of type *config.Config) the server was
+    created with, such as the host address and port to listen on.
 
 Future Enhancements:
-  - Additional fields like Db and config can be added to this struct to include a
-    database connection and configuration settings required for the server to function.
+  - Additional fields like Db can be added to this struct to include a database
+    connection required for the server to function.
 
 Example Usage:
 
 	server := &API{
 		Router: chi.NewRouter(),
+		Config: config.NewConfig(),
 	}
 */
 type API struct {
 	Router *chi.Mux
+	Config *config.Config
 }
 
 /*
-NewAPI creates a new instance of the API server with the given handlers.
+NewAPI creates a new instance of the API server with the given configuration and
+handlers.
 
 This function performs the following steps:
 
  1. Initializes a new router using `chi.NewRouter()` for routing HTTP requests.
  2. Adds middleware to the router, such as the `Logger` middleware for logging HTTP
-    requests.
+    requests. The `Logger` middleware is only registered in the "development"
+    environment, since its per-request formatting and terminal output is a
+    development convenience production deployments should not pay for.
  3. Sets up the server's routes by calling `routes.SetupRoutes(router, h)`, where the
     routes are defined based on the provided handlers.
- 4. Returns a pointer to an `API` instance, which contains the configured router.
+ 4. Returns a pointer to an `API` instance, which contains the configured router and
+    the configuration settings.
 
 The returned `API` instance is ready to handle incoming HTTP requests, with the routes
-and middleware set up according to the provided handlers.
+and middleware set up according to the provided handlers, and it will listen on the
+host and port defined by the configuration.
 
 Example:
   - This function can be used to create a new API instance with custom request handlers
     for various routes.
 */
-func NewAPI(h *handlers.Handlers) *API {
+func NewAPI(cfg *config.Config, h *handlers.Handlers) *API {
 	// Initialise a new `Router` object
 	router := chi.NewRouter()
 
-	// Register the in-built logger
-	router.Use(middleware.Logger)
+	// Register the in-built request logger, but only during development since its
+	// per-request formatting overhead is not worth paying for in production
+	if cfg.Env == "development" {
+		router.Use(middleware.Logger)
+	}
 
 	// Setup the routes (aka the API endpoints) to receive HTTP requests on
 	routes.SetupRoutes(router, h)
@@ -85,6 +99,7 @@ func NewAPI(h *handlers.Handlers) *API {
 	// Return an instance of the `API` struct
 	return &API{
 		Router: router,
+		Config: cfg,
 	}
 }
 
@@ -105,18 +120,19 @@ server.
 */
 
 func (a *API) Run() error {
+	// Build the address to listen on from the configured host and port
+	addr := net.JoinHostPort(a.Config.Host, a.Config.Port)
+
 	// Set up the HTTP server
 	srv := http.Server{
-		// TODO: Remove the hardcoded port number later down the line
-		Addr:         ":8000",
+		Addr:         addr,
 		Handler:      a.Router,
 		IdleTimeout:  time.Minute,
 		ReadTimeout:  10 * time.Second,
 		WriteTimeout: 30 * time.Second,
 	}
 
-	// TODO: Remove the hardcoded port number later down the line
-	log.Printf("Starting the server at [::]:%s", "8000")
+	log.Printf("Starting the server at %s", addr)
 
 	// Start the server
 	err := srv.ListenAndServe()
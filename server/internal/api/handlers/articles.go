@@ -20,7 +20,6 @@ import (
 	"net/http"
 
 	chi "github.com/go-chi/chi/v5"
-	validator "github.com/go-playground/validator/v10"
 	"github.com/google/uuid"
 
 	"github.com/Weburz/burzcontent/server/internal/api/models"
@@ -137,14 +136,7 @@ func (ar *ArticleHandler) GetAllArticles(w http.ResponseWriter, r *http.Request)
 		"articles": articles,
 	}
 
-	w.Header().Set("Content-Type", "application/vnd.api+json")
-	w.WriteHeader(http.StatusOK)
-
-	encoder := json.NewEncoder(w)
-	if err := encoder.Encode(response); err != nil {
-		http.Error(w, "Unable to encode JSON", http.StatusInternalServerError)
-		return
-	}
+	writeJSON(w, http.StatusOK, response)
 }
 
 /*
@@ -206,14 +198,7 @@ func (ar *ArticleHandler) GetArticleByID(w http.ResponseWriter, r *http.Request)
 		"article": article,
 	}
 
-	w.Header().Set("Content-Type", "application/vnd.api+json")
-	w.WriteHeader(http.StatusOK)
-
-	encoder := json.NewEncoder(w)
-	if err := encoder.Encode(response); err != nil {
-		http.Error(w, "Unable to encode JSON", http.StatusInternalServerError)
-		return
-	}
+	writeJSON(w, http.StatusOK, response)
 }
 
 /*
@@ -266,8 +251,6 @@ Example:
   - Response: HTTP 201 Created with a JSON body containing the created article.
 */
 func (ar *ArticleHandler) CreateArticle(w http.ResponseWriter, r *http.Request) {
-	validate := validator.New()
-
 	var newArticle models.Article
 	decoder := json.NewDecoder(r.Body)
 	if err := decoder.Decode(&newArticle); err != nil {
@@ -298,14 +281,7 @@ func (ar *ArticleHandler) CreateArticle(w http.ResponseWriter, r *http.Request)
 		"article": article,
 	}
 
-	w.Header().Set("Content-Type", "application/vnd.api+json")
-	w.WriteHeader(http.StatusCreated)
-
-	encoder := json.NewEncoder(w)
-	if err := encoder.Encode(response); err != nil {
-		http.Error(w, "Unable to encode JSON", http.StatusInternalServerError)
-		return
-	}
+	writeJSON(w, http.StatusCreated, response)
 }
 
 /*
@@ -350,7 +326,6 @@ Example:
 */
 func (ar *ArticleHandler) UpdateArticle(w http.ResponseWriter, r *http.Request) {
 	var updatedArticle models.Article
-	validate := validator.New()
 	if err := validate.Struct(updatedArticle); err != nil {
 		http.Error(w, "Request body validation failed", http.StatusUnprocessableEntity)
 		return
@@ -383,14 +358,7 @@ func (ar *ArticleHandler) UpdateArticle(w http.ResponseWriter, r *http.Request)
 		"article": article,
 	}
 
-	w.Header().Set("Content-Type", "application/vnd.api+json")
-	w.WriteHeader(http.StatusCreated)
-
-	encoder := json.NewEncoder(w)
-	if err := encoder.Encode(response); err != nil {
-		http.Error(w, "Unable to encode JSON", http.StatusInternalServerError)
-		return
-	}
+	writeJSON(w, http.StatusCreated, response)
 }
 
 /*
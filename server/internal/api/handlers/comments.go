@@ -20,8 +20,6 @@ import (
 	"encoding/json"
 	"net/http"
 
-	validator "github.com/go-playground/validator/v10"
-
 	"github.com/Weburz/burzcontent/server/internal/api/models"
 	"github.com/Weburz/burzcontent/server/internal/api/services"
 )
@@ -95,14 +93,7 @@ func (cr *CommentHandler) GetAllComments(w http.ResponseWriter, r *http.Request)
 
 	response := map[string][]models.Comment{"comments": comments}
 
-	w.Header().Set("Content-Type", "application/vnd.api+json")
-	w.WriteHeader(http.StatusOK)
-
-	encoder := json.NewEncoder(w)
-	if err := encoder.Encode(response); err != nil {
-		http.Error(w, err.Error(), http.StatusInternalServerError)
-		return
-	}
+	writeJSON(w, http.StatusOK, response)
 }
 
 /*
@@ -141,11 +132,7 @@ func (cr *CommentHandler) GetCommentsFromArticle(
 
 	response := map[string][]models.Comment{"comments": comments}
 
-	encoder := json.NewEncoder(w)
-	if err := encoder.Encode(response); err != nil {
-		http.Error(w, err.Error(), http.StatusInternalServerError)
-		return
-	}
+	writeJSON(w, http.StatusOK, response)
 }
 
 /*
@@ -182,7 +169,6 @@ func (cr *CommentHandler) AddCommentToArticle(w http.ResponseWriter, r *http.Req
 	}
 
 	// Validate the request body
-	validate := validator.New()
 	if err := validate.Struct(newComment); err != nil {
 		http.Error(w, err.Error(), http.StatusUnprocessableEntity)
 		return
@@ -204,16 +190,8 @@ func (cr *CommentHandler) AddCommentToArticle(w http.ResponseWriter, r *http.Req
 		"comment": *comment,
 	}
 
-	// Set appropriate HTTP headers
-	w.Header().Set("Content-Type", "application/vnd.api+json")
-	w.WriteHeader(http.StatusCreated)
-
 	// Encode the response appropriately before sending it to the client
-	encoder := json.NewEncoder(w)
-	if err := encoder.Encode(response); err != nil {
-		http.Error(w, "Unable to encoder JSON", http.StatusInternalServerError)
-		return
-	}
+	writeJSON(w, http.StatusCreated, response)
 }
 
 /*
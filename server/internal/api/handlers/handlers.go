@@ -10,7 +10,19 @@ and process requests routed to different endpoints.
 */
 package handlers
 
-import "github.com/Weburz/burzcontent/server/internal/api/services"
+import (
+	"encoding/json"
+	"net/http"
+
+	validator "github.com/go-playground/validator/v10"
+
+	"github.com/Weburz/burzcontent/server/internal/api/services"
+)
+
+// validate is the shared validator instance used by all the handlers. The validator
+// caches the struct metadata it gathers through reflection, so reusing a single
+// instance across requests avoids rebuilding that cache on every call.
+var validate = validator.New()
 
 // Handlers holds the handler instances for the various resources in the application.
 type Handlers struct {
@@ -41,3 +53,31 @@ func NewHandlers() *Handlers {
 		CommentHandler: NewCommentHandler(commentService),
 	}
 }
+
+/*
+writeJSON writes the given response payload to the client as JSON.
+
+This function sets the `Content-Type` header to `application/vnd.api+json`, writes
+the provided HTTP status code, and streams the JSON-encoded payload directly to the
+response writer. Every handler sends its JSON responses through this single helper,
+so the encoder is configured in exactly one place and can be swapped for a faster
+implementation later without touching the individual endpoints.
+
+Parameters:
+
+	w: The HTTP response writer used to send the response.
+	statusCode: The HTTP status code to respond with.
+	payload: The value to JSON-encode into the response body.
+
+Returns:
+
+	Nothing. If encoding the payload fails, an error is reported to the client.
+*/
+func writeJSON(w http.ResponseWriter, statusCode int, payload any) {
+	w.Header().Set("Content-Type", "application/vnd.api+json")
+	w.WriteHeader(statusCode)
+
+	if err := json.NewEncoder(w).Encode(payload); err != nil {
+		http.Error(w, "Unable to encode JSON", http.StatusInternalServerError)
+	}
+}
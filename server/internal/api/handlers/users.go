@@ -13,7 +13,6 @@ import (
 	"net/http"
 
 	chi "github.com/go-chi/chi/v5"
-	validator "github.com/go-playground/validator/v10"
 	"github.com/google/uuid"
 
 	"github.com/Weburz/burzcontent/server/internal/api/models"
@@ -64,14 +63,7 @@ func (ur *UserHandler) GetAllUsers(w http.ResponseWriter, r *http.Request) {
 		"users": users,
 	}
 
-	w.Header().Set("Content-Type", "application/vnd.api+json")
-	w.WriteHeader(http.StatusOK)
-
-	encoder := json.NewEncoder(w)
-	if err := encoder.Encode(response); err != nil {
-		http.Error(w, "Unable to encode JSON", http.StatusInternalServerError)
-		return
-	}
+	writeJSON(w, http.StatusOK, response)
 }
 
 /*
@@ -118,13 +110,7 @@ func (ur *UserHandler) GetUserByID(w http.ResponseWriter, r *http.Request) {
 		"user": user,
 	}
 
-	w.Header().Set("Content-Type", "application/vnd.api+json")
-	w.WriteHeader(http.StatusOK)
-
-	if err := json.NewEncoder(w).Encode(response); err != nil {
-		http.Error(w, "Unable to encode JSON", http.StatusInternalServerError)
-		return
-	}
+	writeJSON(w, http.StatusOK, response)
 }
 
 /*
@@ -164,8 +150,6 @@ Note: The user update process in this function is mocked; no actual user data is
 in a database or persistent storage.
 */
 func (ur *UserHandler) UpdateUser(w http.ResponseWriter, r *http.Request) {
-	validate := validator.New()
-
 	userID, err := uuid.Parse(chi.URLParam(r, "id"))
 	if err != nil {
 		http.Error(w, "Invalid User ID", http.StatusBadRequest)
@@ -194,14 +178,7 @@ func (ur *UserHandler) UpdateUser(w http.ResponseWriter, r *http.Request) {
 		"user": user,
 	}
 
-	w.Header().Set("Content-Type", "application/vnd.api+json")
-	w.WriteHeader(http.StatusCreated)
-
-	encoder := json.NewEncoder(w)
-	if err := encoder.Encode(response); err != nil {
-		http.Error(w, "Unable to encode JSON", http.StatusInternalServerError)
-		return
-	}
+	writeJSON(w, http.StatusCreated, response)
 }
 
 /*
@@ -235,8 +212,6 @@ Note: The user creation process in this function is mocked; no actual user is st
 in a database or persistent storage.
 */
 func (ur *UserHandler) CreateUser(w http.ResponseWriter, r *http.Request) {
-	validate := validator.New()
-
 	var newUser models.User
 	decoder := json.NewDecoder(r.Body)
 	if err := decoder.Decode(&newUser); err != nil {
@@ -259,13 +234,7 @@ func (ur *UserHandler) CreateUser(w http.ResponseWriter, r *http.Request) {
 		"user": user,
 	}
 
-	w.Header().Set("Content-Type", "application/vnd.api+json")
-	w.WriteHeader(http.StatusCreated)
-
-	encoder := json.NewEncoder(w)
-	if err := encoder.Encode(response); err != nil {
-		http.Error(w, "Unable to encode JSON", http.StatusInternalServerError)
-	}
+	writeJSON(w, http.StatusCreated, response)
 }
 
 /*
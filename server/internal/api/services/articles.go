@@ -242,8 +242,7 @@ func (as *ArticleServiceImpl) UpdateArticle(
 /*
 DeleteArticle removes an article from the system based on the provided article ID.
 
-This method parses the provided article ID and attempts to delete the article. If the
-ID is invalid, an error is returned indicating the issue. Once the article is
+This method attempts to delete the article with the provided ID. Once the article is
 successfully deleted, a confirmation message is logged. The article's details are
 printed to the console.
 
@@ -251,16 +250,11 @@ Parameters:
   - id: The unique identifier of the article to be deleted.
 
 Returns:
-  - An error if the article ID is invalid or if any other issues arise during the
-    deletion process; nil if the deletion succeeds.
+  - An error if any issues arise during the deletion process; nil if the deletion
+    succeeds.
 */
 func (as *ArticleServiceImpl) DeleteArticle(id uuid.UUID) error {
-	articleID, err := uuid.Parse(id.String())
-	if err != nil {
-		return fmt.Errorf("Invalid Article ID: %w\n", err)
-	}
-
-	article := models.Article{ID: articleID}
+	article := models.Article{ID: id}
 
 	fmt.Printf("%v article is deleted!\n", article)
 	return nil
@@ -109,13 +109,8 @@ model with hardcoded details and an error (if any). If no error occurs, the user
 are returned with a nil error.
 */
 func (us *UserServiceImpl) GetUserByID(id uuid.UUID) (models.User, error) {
-	userID, err := uuid.Parse(id.String())
-	if err != nil {
-		return models.User{}, fmt.Errorf("%w\n", err)
-	}
-
 	user := models.User{
-		ID:    userID,
+		ID:    id,
 		Name:  "Somraj Saha",
 		Email: "somraj.saha@weburz.com",
 	}
@@ -145,20 +140,14 @@ func (us *UserServiceImpl) CreateUser(name, email string) (models.User, error) {
 
 /*
 UpdateUser updates an existing user's details using the provided ID, name, and email. It
-parses the ID to ensure it's valid and returns the updated User model along with any
-error encountered during ID parsing or other operations.
+returns the updated User model along with any error encountered during the operation.
 */
 func (us *UserServiceImpl) UpdateUser(
 	id uuid.UUID,
 	name, email string,
 ) (models.User, error) {
-	userID, err := uuid.Parse(id.String())
-	if err != nil {
-		return models.User{}, fmt.Errorf("%w\n", err)
-	}
-
 	user := models.User{
-		ID:    userID,
+		ID:    id,
 		Name:  name,
 		Email: email,
 	}
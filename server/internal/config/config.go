@@ -9,34 +9,82 @@ and set up the necessary components for the server.
 */
 package config
 
-import "github.com/Weburz/burzcontent/server/internal/api/handlers"
+import (
+	"os"
+	"sync"
+
+	"github.com/Weburz/burzcontent/server/internal/api/handlers"
+)
 
 // Config holds the server configuration settings, such as the port and environment
 // type.
 type Config struct {
+	Host string // The host address the server will bind to
 	Port string // The port on which the server will listen
 	Env  string // The environment type (e.g., "development", "production")
 }
 
+// defaults maps each supported environment to the base configuration used when the
+// server runs in that environment. Selecting a configuration is therefore a single
+// map lookup rather than a chain of conditionals, and only the chosen environment's
+// settings are ever materialized.
+var defaults = map[string]Config{
+	"development": {
+		Host: "localhost", // Serve locally during development
+		Port: "8000",
+		Env:  "development",
+	},
+	"production": {
+		Host: "0.0.0.0", // Bind to all interfaces in production
+		Port: "8000",
+		Env:  "production",
+	},
+}
+
+// environment holds the value of the `ENV` environment variable, read once when the
+// package is initialized. The process environment is fixed at startup, so there is no
+// need to consult os.Getenv again on later configuration lookups.
+var environment = os.Getenv("ENV")
+
+var (
+	// config holds the shared Config instance built on the first call to NewConfig.
+	config *Config
+
+	// once guards the one-time construction of the shared Config instance.
+	once sync.Once
+)
+
 /*
-NewConfig creates and initializes a new instance of Config with default values.
+NewConfig returns the shared Config instance, building it with the defaults of the
+current environment on the first call.
 
-This function returns a new `Config` instance with default values:
-  - Port: "8000"
-  - Env: "development"
+The environment is determined by the `ENV` environment variable (the same variable
+the logger package consults) and is used as a key into the `defaults` table; any
+unrecognized or unset value falls back to the "development" defaults. The
+configuration is constructed exactly once per process and the same instance is
+returned on every subsequent call, so callers can invoke this function freely without
+paying the construction cost again.
 
 These default values can be overridden by setting the respective fields after
-creating the `Config` instance.
+retrieving the `Config` instance.
 
 Example:
   - This function is used to create a configuration object before initializing
     the handlers or setting up the server.
 */
 func NewConfig() *Config {
-	return &Config{
-		Port: "8000",        // Default port
-		Env:  "development", // Default environment
-	}
+	once.Do(func() {
+		// Pick the defaults of the current environment, falling back to the
+		// development settings when the environment is unset or unknown
+		cfg, ok := defaults[environment]
+		if !ok {
+			cfg = defaults["development"]
+		}
+
+		config = &cfg
+	})
+
+	return config
 }
 
 /*
@@ -6,16 +6,23 @@ package logger
 import (
 	"log/slog"
 	"os"
+	"sync"
 )
 
 var (
 	// logger holds the global instance of the logger used throughout the application.
 	logger *slog.Logger
+
+	// once guards the one-time initialization of the global logger instance.
+	once sync.Once
 )
 
-// init initializes the logger with a text handler that writes logs to standard output.
-// The logger instance is created and assigned to the global 'logger' variable.
-func init() {
+// initLogger initializes the logger with a text handler that writes logs to standard
+// output. The logger instance is created and assigned to the global 'logger' variable.
+// It is invoked lazily on the first call to NewLogger rather than at package import,
+// so processes that never log skip the setup cost (including the log file open in
+// production mode).
+func initLogger() {
 	var handler slog.Handler
 
 	// Get the runtime environment type (could be "development" or "production"). It
@@ -53,7 +60,10 @@ func init() {
 
 // NewLogger returns the global logger instance, which can be used to log messages
 // throughout the application. This function provides easy access to the logger
-// without needing to create a new instance.
+// without needing to create a new instance. The logger is initialized on the first
+// call and the same instance is returned on every subsequent call.
 func NewLogger() *slog.Logger {
+	once.Do(initLogger)
+
 	return logger
 }